@@ -5,14 +5,30 @@ The Measurement Library is a set of classes offering full support for
 math using Dimensions, Metrics, and Quantities.
 """
 
-from __future__ import division, unicode_literals
-import six
-
 import decimal
 import math
 import re
 
 ExponentTypographicalSymbols = ["⁰", "", "²", "³", "⁴", "⁵", "⁶", "⁷", "⁸", "⁹"]
+ExponentTypographicalPowers = {"⁰": 0,
+                               "":  1,
+                               "⁻¹": -1,
+                               "²": 2,
+                               "⁻²": -2,
+                               "³": 3,
+                               "⁻³": -3,
+                               "⁴": 4,
+                               "⁻⁴": -4,
+                               "⁵": 5,
+                               "⁻⁵": -5,
+                               "⁶": 6,
+                               "⁻⁶": -6,
+                               "⁷": 7,
+                               "⁻⁷": -7,
+                               "⁸": 8,
+                               "⁻⁸": -8,
+                               "⁹": 9,
+                               "⁻⁹": -9}
 
 class MeasurementParsingException(Exception):
     """
@@ -116,7 +132,7 @@ class Dimension(Immutable):
             if isinstance(self.power, int) and abs(self.power) in range(0, 9 + 1):
                 self.power_as_typographical_symbol = ExponentTypographicalSymbols[abs(self.power)]
             else:
-                self.power_as_typographical_symbol = "^" + six.text_type(abs(self.power))
+                self.power_as_typographical_symbol = "^" + str(abs(self.power))
 
             super(Dimension.Term, self).__init__()
 
@@ -140,31 +156,44 @@ class Dimension(Immutable):
         def __repr__(self):
             "Produces a representation of this Dimension.Term, that when eval()ed, produces a Dimension.Term "
             "equivalent to this one."
-            return "Dimension.Term(" + repr(self.dimension) + ", " + six.text_type(self.power) + ")"
+            return "Dimension.Term(" + repr(self.dimension) + ", " + str(self.power) + ")"
         def __unicode__(self):
             "Produces a string representation of this Dimension.Term, in typographical symbols"
             return self.dimension.typographical_symbol + self.power_as_typographical_symbol
         __str__ = __unicode__
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, name = None, typographical_symbol = None, terms = None, derivation = None):
         """
         measurement treats Dimension objects as flyweights and will try to reuse
-        instances base on the canonicalized terms.
+        instances base on the canonicalized terms, or, for fundamental
+        Dimensions, on their name and typographical symbol.
         """
 
-        if "derivation" in kwargs:
-            cls.__last_canonicalized_terms = Dimension.canonicalize(kwargs["derivation"].terms)
-        elif "terms" in kwargs:
-            cls.__last_canonicalized_terms = Dimension.canonicalize(kwargs["terms"])
+        if derivation is not None:
+            cls.__last_canonicalized_terms = Dimension.canonicalize(derivation.terms)
+        elif terms is not None:
+            cls.__last_canonicalized_terms = Dimension.canonicalize(terms)
             if cls.__last_canonicalized_terms:
                 if cls.__last_canonicalized_terms in Dimension.defined_dimensions_by_terms:
                     return Dimension.defined_dimensions_by_terms[cls.__last_canonicalized_terms]
+
+                # reuse an unnamed Dimension already derived with the same exponents
+                if name is None:
+                    existing = Dimension.dimensions_by_exponents.get(Dimension.exponents_of(cls.__last_canonicalized_terms))
+                    if existing is not None:
+                        return existing
         else:
             cls.__last_canonicalized_terms = None
 
+            # reuse a fundamental Dimension that is still registered under
+            # this name and symbol
+            existing = Dimension.defined_dimensions_by_symbol.get(typographical_symbol or name)
+            if existing is not None and existing.defined and existing.name == name:
+                return existing
+
         return super(Dimension, cls).__new__(cls)
 
-    __slots__ = "frozen", "defined", "name", "typographical_symbol", "terms"
+    __slots__ = "frozen", "defined", "name", "typographical_symbol", "terms", "exponents", "_hash"
 
     def __init__(self, name = None, typographical_symbol = None, terms = None, derivation = None):
         """
@@ -187,6 +216,7 @@ class Dimension(Immutable):
             if not self.typographical_symbol:
                 self.typographical_symbol = name
             self.terms = frozenset([Dimension.Term(self, 1)])
+            self.exponents = Dimension.exponents_of(self.terms)
 
             Dimension.define(self)
         else:
@@ -194,6 +224,7 @@ class Dimension(Immutable):
             self.defined = False
 
             self.terms = Dimension.__last_canonicalized_terms
+            self.exponents = Dimension.exponents_of(self.terms)
             Dimension.__last_canonicalized_terms = None
 
             if name:
@@ -207,6 +238,13 @@ class Dimension(Immutable):
             else:
                 self.name, self.typographical_symbol = Dimension.identify(self.terms)
 
+                if len(Dimension.dimensions_by_exponents) >= Dimension.max_dimensions_by_exponents:
+                    Dimension.dimensions_by_exponents = dict((dimension.exponents, dimension)
+                                                             for dimension in Dimension.defined_dimensions_by_terms.values())
+                Dimension.dimensions_by_exponents.setdefault(self.exponents, self)
+
+        self._hash = hash(self.exponents)
+
         super(Dimension, self).__init__()
 
         self.frozen = True
@@ -214,6 +252,17 @@ class Dimension(Immutable):
     defined_dimensions_by_terms = {}
     defined_dimensions_by_symbol = {}
 
+    dimensions_by_exponents = {}
+    """
+    Every Dimension constructed so far, keyed by its exponents, so that
+    multiplying, dividing and raising Dimensions can find an existing result
+    without building and canonicalizing a list of Dimension.Terms.  Defined
+    Dimensions take precedence over derived ones with the same exponents.
+    When it grows past max_dimensions_by_exponents entries, the derived
+    Dimensions are dropped and only the defined ones are kept.
+    """
+    max_dimensions_by_exponents = 4096
+
     @classmethod
     def all(cls):
         dimensions = []
@@ -237,6 +286,7 @@ class Dimension(Immutable):
         """
         Dimension.defined_dimensions_by_terms[dimension.terms] = dimension
         Dimension.defined_dimensions_by_symbol[dimension.typographical_symbol] = dimension
+        Dimension.dimensions_by_exponents[dimension.exponents] = dimension
         Dimension.parsing_pattern_string = None
         Dimension.parsing_pattern = None
 
@@ -278,6 +328,27 @@ class Dimension(Immutable):
 
         return frozenset(normalized_terms)
 
+    @classmethod
+    def exponents_of(cls, terms):
+        """
+        Expresses canonicalized terms as a tuple of (fundamental Dimension
+        name, power) pairs, sorted by name and leaving out Number, so that
+        Dimensions can be compared and hashed as a single tuple.
+        """
+        return tuple(sorted((term.dimension.name, term.power) for term in terms if not term.scalar))
+
+    @classmethod
+    def combine_exponents(cls, exponents, other_exponents, factor):
+        """
+        Adds other_exponents, each multiplied by factor, to exponents,
+        producing the exponents of a product (factor 1) or quotient (factor
+        -1) of two Dimensions.
+        """
+        powers = dict(exponents)
+        for name, power in other_exponents:
+            powers[name] = powers.get(name, 0) + factor * power
+        return tuple(sorted((name, power) for name, power in powers.items() if power))
+
     @classmethod
     def identify(cls, terms):
         """
@@ -383,18 +454,8 @@ class Dimension(Immutable):
 
             dimension = Dimension.defined_dimensions_by_symbol[matched_symbol]
 
-            powers = {"⁰": 0,
-                      "":  1,
-                      "²": 2,
-                      "³": 3,
-                      "⁴": 4,
-                      "⁵": 5,
-                      "⁶": 6,
-                      "⁷": 7,
-                      "⁸": 8,
-                      "⁹": 9}
-            if matched_power in powers:
-                power = powers[matched_power]
+            if matched_power in ExponentTypographicalPowers:
+                power = ExponentTypographicalPowers[matched_power]
             else:
                 power = int(matched_power.replace("^", ""))
 
@@ -412,32 +473,38 @@ class Dimension(Immutable):
 
 
     def __hash__(self):
-        "Computes a hash value for this Dimension."
-        hash_to_return = 0
-        for term in self.terms:
-            hash_to_return = hash_to_return ^ hash(term)
-        return hash_to_return
+        "Returns the hash value for this Dimension, computed at construction."
+        return self._hash
 
     def __eq__(self, other):
         "Tests whether a Dimension is equivalent to this Dimension."
-        if other == None:         return False
-        if id(self) == id(other): return True
+        if self is other:  return True
+        if other is None:  return False
 
-        return self.terms == other.terms
+        return self._hash == other._hash and self.exponents == other.exponents
     def __ne__(self, other):
         "Tests whether a Dimension is different from this Dimension."
         return not self.__eq__(other)
 
     def __mul__(self, other):
         "Derives a new Dimension through multiplication."
+        exponents = Dimension.combine_exponents(self.exponents, other.exponents, 1)
+        if exponents in Dimension.dimensions_by_exponents:
+            return Dimension.dimensions_by_exponents[exponents]
         return Dimension(terms = [Dimension.Term(self, 1), Dimension.Term(other, 1)])
 
     def __pow__(self, power):
         "Derives a new Dimension by raising this dimension to the given power."
+        exponents = Dimension.combine_exponents((), self.exponents, power)
+        if exponents in Dimension.dimensions_by_exponents:
+            return Dimension.dimensions_by_exponents[exponents]
         return Dimension(terms = [Dimension.Term(self, power)])
 
     def __truediv__(self, other):
         "Derives a new Dimension through division."
+        exponents = Dimension.combine_exponents(self.exponents, other.exponents, -1)
+        if exponents in Dimension.dimensions_by_exponents:
+            return Dimension.dimensions_by_exponents[exponents]
         return Dimension(terms = [Dimension.Term(self, 1), Dimension.Term(other, -1)])
     __div__ = __truediv__
 
@@ -472,7 +539,7 @@ class Metric(Immutable):
         the first power as their only term.
         """
 
-        __slots__ = "frozen", "prefix", "metric", "power", "one", "power_as_typographical_symbol"
+        __slots__ = "frozen", "prefix", "metric", "power", "one", "power_as_typographical_symbol", "_key", "_hash"
 
         def __init__(self, prefix, metric, power):
             self.prefix = prefix
@@ -495,24 +562,26 @@ class Metric(Immutable):
             if isinstance(self.power, int) and abs(self.power) in range(0, 9 + 1):
                 self.power_as_typographical_symbol = ExponentTypographicalSymbols[abs(self.power)]
             else:
-                self.power_as_typographical_symbol = "^" + six.text_type(abs(self.power))
+                self.power_as_typographical_symbol = "^" + str(abs(self.power))
+
+            # the identity of a Metric.Term, compared and hashed as a unit
+            self._key = (self.prefix, self.metric.name, self.power)
+            self._hash = hash(self.prefix) ^ hash(self.metric.name) ^ hash(self.power)
 
             super(Metric.Term, self).__init__()
 
             self.frozen = True
 
         def __hash__(self):
-            "Computes a hash value for this Metric.Term."
-            return hash(self.prefix) ^ hash(self.metric.name) ^ hash(self.power)
+            "Returns the hash value for this Metric.Term, computed at construction."
+            return self._hash
 
         def __eq__(self, other):
             "Tests whether a Metric.Term is equivalent to this Metric.Term."
-            if other == None:         return False
-            if id(self) == id(other): return True
+            if self is other:  return True
+            if other is None:  return False
 
-            return (self.prefix == other.prefix and
-                    self.metric.name == other.metric.name and
-                    self.power == other.power)
+            return self._hash == other._hash and self._key == other._key
         def __ne__(self, other):
             "Tests whether a Metric.Term is different from this Metric.Term."
             return not self.__eq__(other)
@@ -522,7 +591,7 @@ class Metric(Immutable):
             Produces a representation of this Metric.Term that, when eval()ed,
             will produce a Metric.Term equivalent to this one.
             """
-            return "Metric.Term(" + repr(self.prefix) + ", " + repr(self.metric) + ", " + six.text_type(self.power) + ")"
+            return "Metric.Term(" + repr(self.prefix) + ", " + repr(self.metric) + ", " + str(self.power) + ")"
         def __unicode__(self):
             "Produces a typographical string representing this Metric.Term."
             return ((self.prefix.typographical_symbol if self.prefix.typographical_symbol != '1' else '') +
@@ -537,7 +606,7 @@ class Metric(Immutable):
         various powers of 10.
         """
 
-        __slots__ = "frozen", "name", "typographical_symbol", "base", "power"
+        __slots__ = "frozen", "name", "typographical_symbol", "base", "power", "magnitude"
 
         def __new__(cls, name, typographical_symbol, base, power):
             "Attempts to resolve a pre-defined Prefix."
@@ -552,7 +621,8 @@ class Metric(Immutable):
             Creates a new Metric.Prefix, with it's name and
             typographical_symbol, and it's definition as an integral base and
             an integral power.  For example, 'kilo-' is defined as 10^3 and
-            'nano-' is defined as 10^-9.
+            'nano-' is defined as 10^-9.  The resulting multiplier is computed
+            once and kept as the Prefix's magnitude.
             """
 
             if hasattr(self, "frozen"):
@@ -562,6 +632,7 @@ class Metric(Immutable):
             self.typographical_symbol = typographical_symbol
             self.base = base
             self.power = power
+            self.magnitude = base**power
 
             Metric.Prefix.define(self)
 
@@ -583,6 +654,11 @@ class Metric(Immutable):
             Metric.Prefix.defined_prefixes_by_value[(prefix.base, prefix.power)] = prefix
             Metric.Prefix.defined_prefixes_by_symbol[prefix.typographical_symbol] = prefix
 
+            Metric.parsed_metrics = {}
+            Quantity.parsed_quantities = {}
+            Metric.parsing_pattern_string = None
+            Metric.parsing_pattern = None
+
         @classmethod
         def find(cls, base, power):
             """
@@ -594,13 +670,32 @@ class Metric(Immutable):
                 return Metric.Prefix.defined_prefixes_by_value[(base, power)]
             return None
 
+        @classmethod
+        def collect(cls, base, power):
+            """
+            Resolves the Metric.Prefix for a base and power that result from
+            prefix arithmetic, defining an unnamed Metric.Prefix (such as
+            '10^4') when none is registered.  A power of zero collects to no
+            prefix at all, and None is returned.
+            """
+            if not power:
+                return None
+
+            collected_prefix = Metric.Prefix.defined_prefixes_by_value.get((base, power))
+            if collected_prefix is None:
+                collected_prefix = Metric.Prefix("%s^%s" % (base, power), "%s^%s" % (base, power), base, power)
+            return collected_prefix
+
         def __mul__(self, other):
             """
             When multiplying a Prefix by a Metric, produces a derived Metric.
             Example: Kilo * Meter produces the unit kilometer
             """
             if isinstance(other, Metric):
-                return Metric(terms = [Metric.Term(self, other, 1)])
+                # a prefix of power zero (like 'one') leaves the Metric unchanged
+                if self.power == 0:
+                    return other
+                return Metric.memoize_derivation("prefix", other, id(self), self, lambda: [Metric.Term(self, other, 1)])
             else:
                 return NotImplemented
 
@@ -614,16 +709,7 @@ class Metric(Immutable):
                 if self.base != other.base and (self.power != 0) and (other.power != 0):
                     return NotImplemented
 
-                collected_power = self.power + other.power
-                if not collected_power:
-                    return None
-
-                collected_prefix = Metric.Prefix.find(self.base, collected_power)
-                if not collected_prefix:
-                    collected_prefix = Metric.Prefix("%s^%s" % (self.base, collected_power), "%s^%s" % (self.base, collected_power),
-                                                     self.base, collected_power)
-
-                return collected_prefix
+                return Metric.Prefix.collect(self.base, self.power + other.power)
             else:
                 return NotImplemented
 
@@ -637,16 +723,7 @@ class Metric(Immutable):
                 if self.base != other.base:
                     return NotImplemented
 
-                collected_power = self.power - other.power
-                if not collected_power:
-                    return None
-
-                collected_prefix = Metric.Prefix.find(self.base, collected_power)
-                if not collected_prefix:
-                    collected_prefix = Metric.Prefix("%s^%s" % (self.base, collected_power), "%s^%s" % (self.base, collected_power),
-                                                     self.base, collected_power)
-
-                return collected_prefix
+                return Metric.Prefix.collect(self.base, self.power - other.power)
             else:
                 return NotImplemented
 
@@ -670,7 +747,7 @@ class Metric(Immutable):
             Produces a representation of this Metric.Prefix that, when
             eval()ed, will produce an equivalent Metric.Prefix.
             """
-            return "Metric.Prefix(" + repr(self.name) + ", " + repr(self.typographical_symbol) + ", " + six.text_type(self.base) + ", " + six.text_type(self.power) + ")"
+            return "Metric.Prefix(" + repr(self.name) + ", " + repr(self.typographical_symbol) + ", " + str(self.base) + ", " + str(self.power) + ")"
         def __unicode__(self):
             "Represents this Metric.Prefix as a typographical symbol."
             return self.typographical_symbol
@@ -694,7 +771,7 @@ class Metric(Immutable):
 
         return super(Metric, cls).__new__(cls)
 
-    __slots__ = "frozen", "defined", "name", "plural_name", "typographical_symbol", "dimension", "terms", "_reduced"
+    __slots__ = "frozen", "defined", "name", "plural_name", "typographical_symbol", "dimension", "terms", "_hash", "_reduced", "_normalized", "_numerator", "_denominator"
 
     def __init__(self, name = None, typographical_symbol = None, dimension = None, terms = None, derivation = None):
         """
@@ -747,6 +824,10 @@ class Metric(Immutable):
         else:
             self.plural_name = self.name + "s"
 
+        # the terms are canonicalized and frozen by now, so the hash can be
+        # computed once rather than on every lookup
+        self._hash = Metric.hash_terms(self.terms)
+
         super(Metric, self).__init__()
 
         self.frozen = True
@@ -769,10 +850,31 @@ class Metric(Immutable):
     "favored" as the standard base Metric for that Dimension.  These will be
     the SI metrics to begin with.
     """
+    derived_metrics_by_operation = {}
+    """
+    A dictionary of (operator, id(Metric), operand key) => (Metric, operand,
+    derived Metric), memoizing the results of Metric arithmetic.  Metrics
+    are keyed by identity, since equivalent Metrics (like Radian and One)
+    may still be named differently, and the operands are kept alive by the
+    entry so that their identities can't be reused.  This is cleared
+    whenever a new Metric is defined, since the definition may give a name
+    to a previously derived Metric, and when it grows past max_derived_metrics
+    entries.
+    """
+    max_derived_metrics = 4096
+
+    all_metrics = None
+    """
+    A tuple of every defined Metric, built on demand by Metric.all() and
+    discarded whenever a new Metric is defined.
+    """
 
     @classmethod
     def all(cls):
-        return list(Metric.defined_metrics_by_symbol.values())
+        "Returns a tuple of every defined Metric."
+        if Metric.all_metrics is None:
+            Metric.all_metrics = tuple(Metric.defined_metrics_by_symbol.values())
+        return Metric.all_metrics
     @classmethod
     def get_by_name(cls, name):
         for metric in list(Metric.defined_metrics_by_symbol.values()):
@@ -795,6 +897,10 @@ class Metric(Immutable):
         if metric.dimension not in Metric.base_metric_of:
             Metric.base_metric_of[metric.dimension] = metric
 
+        Metric.all_metrics = None
+        Metric.derived_metrics_by_operation = {}
+        Metric.parsed_metrics = {}
+        Quantity.parsed_quantities = {}
         Metric.parsing_pattern_string = None
         Metric.parsing_pattern = None
 
@@ -807,11 +913,19 @@ class Metric(Immutable):
         with the combined powers, and to remove extraneous 1s terms.
         """
 
-        flattened_terms = []
+        metric_powers = {}
         dimension_terms = []
 
+        def collect(prefix, metric, power):
+            "Accumulates a power for a (prefix, metric) pair without building intermediate Metric.Terms."
+            if not prefix:
+                prefix = Metric.Prefix.find(10, 0) or Metric.Prefix("one", "1", 10, 0)
+            base_metric = (prefix, metric)
+            metric_powers[base_metric] = metric_powers.get(base_metric, 0) + power
+
         # flatten the powers of each term down to individual terms raised to the power of the outer term
-        # for example, take (A^2 * B^3)^4 and make it A4 * A4 * B4 * B4 * B4
+        # for example, take (A^2 * B^3)^4 and make it A4 * A4 * B4 * B4 * B4, collecting the powers of
+        # each prefixed metric as we go
         for term in terms:
             dimension_terms.append(Dimension.Term(term.metric.dimension, term.power))
 
@@ -825,38 +939,35 @@ class Metric(Immutable):
                     fractional = 0 - fractional
                 whole = int(inner_term.power - (fractional))
 
-                for i in range(abs(whole)):
-                    if not applied_outer_prefix:
-                        # only apply outer prefixes to the first metric in the numerator
-                        applied_outer_prefix = True
-                        flattened_terms.append(Metric.Term(term.prefix + inner_term.prefix, inner_term.metric, sign * term.power))
-                    else:
-                        flattened_terms.append(Metric.Term(inner_term.prefix, inner_term.metric, sign * term.power))
+                units = abs(whole)
+                if units and not applied_outer_prefix:
+                    # only apply outer prefixes to the first metric in the numerator
+                    applied_outer_prefix = True
+                    collect(term.prefix + inner_term.prefix, inner_term.metric, sign * term.power)
+                    units -= 1
+
+                if isinstance(term.power, int):
+                    # integral powers can be collected for all of the remaining units at once
+                    if units:
+                        collect(inner_term.prefix, inner_term.metric, units * sign * term.power)
+                else:
+                    # keep summing unit by unit, so fractional powers round exactly as they always have
+                    for i in range(units):
+                        collect(inner_term.prefix, inner_term.metric, sign * term.power)
 
                 if fractional != 0:
                     if not applied_outer_prefix:
                         # only apply outer prefixes to the first metric in the numerator
                         applied_outer_prefix = True
-                        flattened_terms.append(Metric.Term(term.prefix + inner_term.prefix, inner_term.metric, fractional * term.power))
+                        collect(term.prefix + inner_term.prefix, inner_term.metric, fractional * term.power)
                     else:
-                        flattened_terms.append(Metric.Term(inner_term.prefix, inner_term.metric, fractional * term.power))
-
-        # collect and normalize the powers
-        metric_powers = {}
-        for term in flattened_terms:
-            base_metric = (term.prefix, term.metric)
-            if base_metric not in metric_powers:
-                metric_powers[base_metric] = Metric.Term(term.prefix, term.metric, 0)
-
-            metric_powers[base_metric] = Metric.Term(term.prefix, term.metric,
-                                                     metric_powers[base_metric].power + term.power)
+                        collect(inner_term.prefix, inner_term.metric, fractional * term.power)
 
         # normalize and reduce down terms whose powers have become 0
         normalized_terms = []
-        for metric in metric_powers:
-            term = metric_powers[metric]
-            if term.power:
-                normalized_terms.append(term)
+        for (prefix, metric), power in metric_powers.items():
+            if power:
+                normalized_terms.append(Metric.Term(prefix, metric, power))
 
         # if everything has been normalized down to Number, inject Number as the dimension
         if not normalized_terms:
@@ -913,6 +1024,15 @@ class Metric(Immutable):
 
         return (name, symbol)
 
+    parsed_metrics = {}
+    """
+    A cache of typographical symbol => Metric, holding the Metrics that have
+    already been parsed.  It is cleared whenever a Metric or Metric.Prefix is
+    defined, since either may change how a symbol is parsed, and when it grows
+    past max_parsed_metrics entries.
+    """
+    max_parsed_metrics = 1024
+
     @classmethod
     def parse(cls, typographical_symbol):
         "Parses a typographical symbol representing a Metric into a Metric."
@@ -921,6 +1041,9 @@ class Metric(Immutable):
         if typographical_symbol == "10":
             return Ten
 
+        if typographical_symbol in Metric.parsed_metrics:
+            return Metric.parsed_metrics[typographical_symbol]
+
         parts = typographical_symbol.split("/")
 
         numerator_terms = Metric.symbol_string_to_terms(parts[0])
@@ -936,7 +1059,12 @@ class Metric(Immutable):
         if not terms:
           raise MeasurementParsingException("'%s' doesn't seem to correspond to any defined Metrics." % typographical_symbol)
 
-        return Metric(terms = terms)
+        metric = Metric(terms = terms)
+
+        if len(Metric.parsed_metrics) >= Metric.max_parsed_metrics:
+            Metric.parsed_metrics = {}
+        Metric.parsed_metrics[typographical_symbol] = metric
+        return metric
 
     @classmethod
     def rebuild_parsing_pattern(cls):
@@ -1011,28 +1139,8 @@ class Metric(Immutable):
 
             metric = Metric.defined_metrics_by_symbol[matched_symbol]
 
-            powers = {
-                      "⁰": 0,
-                      "":  1,
-                      "⁻¹": -1,
-                      "²": 2,
-                      "⁻²": -2,
-                      "³": 3,
-                      "⁻³": -3,
-                      "⁴": 4,
-                      "⁻⁴": -4,
-                      "⁵": 5,
-                      "⁻⁵": -5,
-                      "⁶": 6,
-                      "⁻⁶": -6,
-                      "⁷": 7,
-                      "⁻⁷": -7,
-                      "⁸": 8,
-                      "⁻⁸": -8,
-                      "⁹": 9,
-                      "⁻⁹": -9}
-            if matched_power in powers:
-                power = powers[matched_power]
+            if matched_power in ExponentTypographicalPowers:
+                power = ExponentTypographicalPowers[matched_power]
             else:
                 power = int(matched_power.replace("^", ""))
 
@@ -1042,39 +1150,66 @@ class Metric(Immutable):
 
 
     def numerator(self):
-        return Metric(terms = [t for t in self.terms if t.power > 0])
+        "Returns the Metric formed by the positively-powered terms of this Metric."
+        if not hasattr(self, "_numerator"):
+            self._internal__setattr__("_numerator", Metric(terms = [t for t in self.terms if t.power > 0]))
+        return self._numerator
     def denominator(self):
-        return One / Metric(terms = [t for t in self.terms if t.power < 0])
+        "Returns the Metric formed by the negatively-powered terms of this Metric, inverted."
+        if not hasattr(self, "_denominator"):
+            self._internal__setattr__("_denominator", One / Metric(terms = [t for t in self.terms if t.power < 0]))
+        return self._denominator
 
 
-    def __hash__(self):
-        "Computes a hash value for this Metric."
+    @classmethod
+    def memoize_derivation(cls, operator, metric, operand_key, operand, terms):
+        """
+        Returns the Metric derived by applying an operator to a Metric and an
+        operand, building it from the callable terms only the first time.
+        """
+        key = (operator, id(metric), operand_key)
+        if key in Metric.derived_metrics_by_operation:
+            return Metric.derived_metrics_by_operation[key][2]
+
+        derived = Metric(terms = terms())
+
+        if len(Metric.derived_metrics_by_operation) >= Metric.max_derived_metrics:
+            Metric.derived_metrics_by_operation = {}
+        Metric.derived_metrics_by_operation[key] = (metric, operand, derived)
+
+        return derived
+
+    @classmethod
+    def hash_terms(cls, terms):
+        "Computes the hash value of a Metric with the given canonicalized terms."
         hash_to_return = 0
-        for term in self.terms:
+        for term in terms:
             hash_to_return = hash_to_return ^ hash(term)
         return hash_to_return
 
+    def __hash__(self):
+        "Returns the hash value for this Metric, computed at construction."
+        return self._hash
+
     def __eq__(self, other):
         """
         Tests whether this Metric is equivalent to another Metric.  Also,
         allows the numbers 1 and 10 to be equivalent to One and Ten.
         """
-        if other == None:
-            return False
-        elif id(self) == id(other):
+        if self is other:
             return True
+        elif other is None:
+            return False
         elif isnumber(other):
-            if self == One:
+            if self is One or self == One:
                 return other == 1
-            elif self == Ten:
+            elif self is Ten or self == Ten:
                 return other == 10
             else:
                 return NotImplemented
         elif isinstance(other, Metric):
-            reduced_self = self.reduce()
-            reduced_other = other.reduce()
-            return (reduced_self.magnitude == reduced_other.magnitude and
-                    reduced_self.metric.terms == reduced_other.metric.terms)
+            normalized, other_normalized = self.normalize(), other.normalize()
+            return normalized is other_normalized or normalized == other_normalized
         return NotImplemented
     def __ne__(self, other):
         "Tests whether this Metric is different from another Metric."
@@ -1087,7 +1222,13 @@ class Metric(Immutable):
     def __mul__(self, other):
         "When multiplying Metrics, derives a new metric through multiplication.  When multiplying by numbers, produces a Quantity in this Metric."
         if isinstance(other, Metric):
-            return Metric(terms = [Metric.Term(None, self, 1), Metric.Term(None, other, 1)])
+            # One is the multiplicative identity, so there is nothing to derive
+            if self is One:
+                return other
+            if other is One:
+                return self
+            return Metric.memoize_derivation("*", self, id(other), other,
+                                             lambda: [Metric.Term(None, self, 1), Metric.Term(None, other, 1)])
         elif isnumber(other):
             return Quantity(other, self)
         return NotImplemented
@@ -1099,12 +1240,20 @@ class Metric(Immutable):
 
     def __pow__(self, power):
         "Derives a new metric by raising this one to the given power."
+        if power == 1:
+            return self
+        if isinstance(power, (int, float)):
+            return Metric.memoize_derivation("**", self, power, power,
+                                             lambda: [Metric.Term(None, self, power)])
         return Metric(terms = [Metric.Term(None, self, power)])
 
     def __truediv__(self, other):
         "When dividing Metrics, derives a new metric through division.  When dividing by numbers, produces a Quantity in this Metric."
         if isinstance(other, Metric):
-            return Metric(terms = [Metric.Term(None, self, 1), Metric.Term(None, other, -1)])
+            if other is One:
+                return self
+            return Metric.memoize_derivation("/", self, id(other), other,
+                                             lambda: [Metric.Term(None, self, 1), Metric.Term(None, other, -1)])
         elif isnumber(other):
             return Quantity(1.0 / other, self)
         return NotImplemented
@@ -1123,21 +1272,56 @@ class Metric(Immutable):
         if not hasattr(self, "_reduced"):
             reduced_magnitude = 1
             reduced_metric_terms = []
+            prefixed = False
 
             for term in self.terms:
                 if term.metric.name == "ten":
+                    prefixed = True
                     if term.power != 0:
                         reduced_magnitude *= (10**term.power) * (term.prefix.base**(term.prefix.power * term.power))
                 else:
-                    reduced_magnitude *= term.prefix.base**(term.prefix.power * term.power)
+                    if term.prefix.power != 0:
+                        prefixed = True
+                    if term.power == 1 or term.prefix.power == 0:
+                        reduced_magnitude *= term.prefix.magnitude
+                    else:
+                        reduced_magnitude *= term.prefix.base**(term.prefix.power * term.power)
                     reduced_metric_terms.append(Metric.Term(None, term.metric, term.power))
 
+            if not prefixed:
+                # nothing to strip away, so this Metric is its own reduction
+                reduced_metric = self
+            else:
+                # the reduced terms are usually already canonical, in which
+                # case a registered Metric (like the gram-based terms of Ohm)
+                # can be found directly, without canonicalizing again
+                signature = frozenset(reduced_metric_terms)
+                if (len(signature) == len(reduced_metric_terms) and
+                    signature in Metric.defined_metrics_by_terms):
+                    reduced_metric = Metric.defined_metrics_by_terms[signature]
+                else:
+                    reduced_metric = Metric(terms = reduced_metric_terms)
+
             # sneak past the Immutable base class for caching this lazy-
             # evaluated property
-            self._internal__setattr__("_reduced", Quantity(reduced_magnitude, Metric(terms = reduced_metric_terms)))
+            self._internal__setattr__("_reduced", Quantity(reduced_magnitude, reduced_metric))
 
         return self._reduced
 
+    def normalize(self):
+        """
+        Returns the normal form of this Metric: a tuple of its reduced
+        magnitude and the (name, power) pairs of its reduced terms.  Two
+        Metrics are equivalent exactly when their normal forms are equal.
+        """
+        if not hasattr(self, "_normalized"):
+            reduced = self.reduce()
+            normalized = (reduced.magnitude,
+                          tuple(sorted((term.metric.name, term.power) for term in reduced.metric.terms)))
+            self._internal__setattr__("_normalized", normalized)
+
+        return self._normalized
+
 
     def __repr__(self):
         "Produces a representation of this Metric that, when eval()ed, produces a Metric equivalent to this one."
@@ -1224,6 +1408,16 @@ class Metric(Immutable):
             else:
                 raise MetricConversionError("Quantity '%s' is not convertible with this conversion function between %s and %s" % (quantity, self.from_metric, self.to_metric))
 
+    @classmethod
+    def register_conversions(cls, conversions):
+        """
+        Registers a ScalarConversion for each (scalar, numerator Metric,
+        denominator Metric) in conversions, as in (12, Inch, Foot) for the
+        twelve inches in a foot.  Returns the registered ScalarConversions.
+        """
+        return [Metric.ScalarConversion(Quantity(scalar, numerator / denominator))
+                for scalar, numerator, denominator in conversions]
+
     def is_convertible_to(self, other):
         """
         Returns a boolean indicating whether a Conversion exists that can
@@ -1261,7 +1455,7 @@ class Metric(Immutable):
     @classmethod
     def _coerced_multiply(cls, left, right):
         if isinstance(left, float) and isinstance(right, decimal.Decimal):
-            return decimal.Decimal(six.text_type(left)) * right
+            return decimal.Decimal(str(left)) * right
         else:
             return left * right
 
@@ -1379,6 +1573,18 @@ class Quantity(Immutable):
     division.
     """
 
+    parsing_pattern = re.compile(r"(?P<magnitude>((\(?\-?[\d]+\.?[\d]?)[\+\-]([\d]+\.?[\d]?)j\)?)|(\-?[\d]+\.?[\d]*))\s?(?P<metric>.*)")
+    "The regular expression used to split a string into a magnitude and a Metric symbol."
+
+    parsed_quantities = {}
+    """
+    A cache of (string, type) => Quantity, holding the Quantities that have
+    already been parsed.  Strings that fail to parse are not cached.  It is
+    cleared whenever a Metric or Metric.Prefix is defined, and when it grows
+    past max_parsed_quantities entries.
+    """
+    max_parsed_quantities = 4096
+
     @classmethod
     def parse(cls, quantity_string, to = None):
         """
@@ -1399,9 +1605,11 @@ class Quantity(Immutable):
         True
         """
 
-        pattern = re.compile(r"(?P<magnitude>((\(?\-?[\d]+\.?[\d]?)[\+\-]([\d]+\.?[\d]?)j\)?)|(\-?[\d]+\.?[\d]*))\s?(?P<metric>.*)")
+        key = (quantity_string, to)
+        if key in Quantity.parsed_quantities:
+            return Quantity.parsed_quantities[key]
 
-        match = pattern.match(quantity_string)
+        match = Quantity.parsing_pattern.match(quantity_string)
         if not match:
             raise MeasurementParsingException("Could not parse '%s' to a Quantity." % quantity_string)
 
@@ -1432,24 +1640,33 @@ class Quantity(Immutable):
         else:
             metric = Metric.parse(components["metric"])
 
-        return Quantity(magnitude, metric)
+        quantity = Quantity(magnitude, metric)
+
+        if len(Quantity.parsed_quantities) >= Quantity.max_parsed_quantities:
+            Quantity.parsed_quantities = {}
+        Quantity.parsed_quantities[key] = quantity
+
+        return quantity
 
-    __slots__ = "frozen", "magnitude", "metric"
+    __slots__ = "frozen", "magnitude", "metric", "_hash", "_composite_values", "_reduced"
 
     def __init__(self, magnitude, metric):
         "Creates a new Quantity with the given magnitude and metric."
-        self.magnitude = magnitude
+        # set the slots directly, skipping the frozen check that __setattr__
+        # would otherwise make for each of them
+        if isinstance(metric, str):
+            metric = Metric.parse(metric)
 
-        if isinstance(metric, six.text_type):
-            self.metric = Metric.parse(metric)
-        else:
-            self.metric = metric
+        self._internal__setattr__("magnitude", magnitude)
+        self._internal__setattr__("metric", metric)
 
-        self.frozen = True
+        self._internal__setattr__("frozen", True)
 
     def __composite_values__(self):
         "Allows Quantity to be stored as a composite value using SQLAlchemy."
-        return self.magnitude, self.metric.typographical_symbol
+        if not hasattr(self, "_composite_values"):
+            self._internal__setattr__("_composite_values", (self.magnitude, self.metric.typographical_symbol))
+        return self._composite_values
 
     def to(self, desired_metric):
         "Converts this quantity to the desired metric."
@@ -1457,12 +1674,21 @@ class Quantity(Immutable):
 
     def reduce(self):
         "Reduces this quantity down to a metric with no prefixes."
-        reduced_metric = self.metric.reduce()
-        return Quantity(self.magnitude * reduced_metric.magnitude, reduced_metric.metric)
+        if not hasattr(self, "_reduced"):
+            reduced_metric = self.metric.reduce()
+            if reduced_metric.metric is self.metric:
+                # no prefixes to apply, so the magnitude is unchanged (None stands in for self,
+                # which would otherwise keep this Quantity alive in a reference cycle)
+                self._internal__setattr__("_reduced", None)
+            else:
+                self._internal__setattr__("_reduced", Quantity(self.magnitude * reduced_metric.magnitude, reduced_metric.metric))
+        return self if self._reduced is None else self._reduced
 
     def __hash__(self):
-        "Computes the hash value for this Quantity."
-        return hash(self.metric) ^ hash(self.magnitude)
+        "Returns the hash value for this Quantity, computed on first use."
+        if not hasattr(self, "_hash"):
+            self._internal__setattr__("_hash", hash(self.metric) ^ hash(self.magnitude))
+        return self._hash
 
     def __bool__(self):
         "Tests whether this Quantity is non-zero."
@@ -1471,8 +1697,11 @@ class Quantity(Immutable):
 
     def _coerce_magnitude(self, other):
         if isinstance(other, Quantity):
+            # only mixes of Decimal and float need coercing
+            if type(self.magnitude) is type(other.magnitude):
+                return other
             if isinstance(self.magnitude, decimal.Decimal) and isinstance(other.magnitude, float):
-                return Quantity(decimal.Decimal(six.text_type(other.magnitude)), other.metric)
+                return Quantity(decimal.Decimal(str(other.magnitude)), other.metric)
             elif isinstance(self.magnitude, float) and isinstance(other.magnitude, decimal.Decimal):
                 return Quantity(float(other.magnitude), other.metric)
             else:
@@ -1485,8 +1714,16 @@ class Quantity(Immutable):
         this Quantity's Metric is One, allows comparing raw numbers, as in
         Quantity(4, One) == 4.0
         """
-        if other == None:         return False
-        if id(self) == id(other): return True
+        if self is other:  return True
+        if other is None:  return False
+
+        # in the same Metric, with magnitudes of the same type, differing
+        # hashes (where both have already been computed) mean differing magnitudes
+        if (type(other) is Quantity and self.metric is other.metric and
+            type(self.magnitude) is type(other.magnitude)):
+            if hasattr(self, "_hash") and hasattr(other, "_hash") and self._hash != other._hash:
+                return False
+            return self.magnitude == other.magnitude
 
         other = self._coerce_magnitude(other)
 
@@ -1507,8 +1744,6 @@ class Quantity(Immutable):
         this Quantity's Metric is One, allows comparing raw numbers, as in
         Quantity(4, One) == 4.0
         """
-        other = self._coerce_magnitude(other)
-
         equal = self.__eq__(other)
         if equal == NotImplemented:
             return NotImplemented
@@ -1520,6 +1755,11 @@ class Quantity(Immutable):
         Metric (allowing comparison with raw numbers if this Quantity's Metric
         is One).
         """
+        # sorting compares Quantities in the same Metric over and over
+        if (type(other) is Quantity and self.metric is other.metric and
+            type(self.magnitude) is type(other.magnitude)):
+            return self.magnitude < other.magnitude
+
         other = self._coerce_magnitude(other)
 
         if isinstance(other, Quantity):
@@ -1628,6 +1868,12 @@ class Quantity(Immutable):
 
     def __pow__(self, power):
         "Raises this Quantity (both magnitude and metric) to the given power."
+        # integral powers are the common case, and need no unwrapping
+        if type(power) is int:
+            if power == 1:
+                return self
+            return Quantity(self.magnitude**power, self.metric**power)
+
         if isinstance(power, Quantity) and power.metric == One:
             power = power.magnitude
 
@@ -1656,15 +1902,17 @@ class Quantity(Immutable):
         typographical symbols.
         """
         if self.metric == One:
-            return six.text_type(self.magnitude)
+            return str(self.magnitude)
         elif self.metric == Ten:
-            return six.text_type(10 * self.magnitude)
+            return str(10 * self.magnitude)
         else:
-            return six.text_type(self.magnitude) + " " + six.text_type(self.metric)
+            return str(self.magnitude) + " " + str(self.metric)
     __str__ = __unicode__
 
 class Constant(Quantity):
 
+    __slots__ = "name", "typographical_symbol"
+
     def __init__(self, magnitude, metric, name, typographical_symbol = None):
         self.name = name
         self.typographical_symbol = typographical_symbol
@@ -2,8 +2,6 @@
 World Currencies, the metrics of economic exchange.
 """
 
-from __future__ import division, unicode_literals
-
 import measurement
 
 UnitedStatesDollar = measurement.Metric("United States Dollar", "USD", measurement.Exchange)
@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-from __future__ import unicode_literals, print_function
 
 import atexit
 import code
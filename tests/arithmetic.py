@@ -1,5 +1,3 @@
-from __future__ import division, unicode_literals
-
 from decimal import Decimal
 
 FloatingPointTolerance = 0.000000000001
@@ -43,6 +41,28 @@ def assert_close(left, right, failure_message = "", tolerance = None):
 
     assert left == right, failure_message + ": %s != %s" % (left, right)
 
+def assert_close_batch(pairs, failure_message = "", tolerance = None):
+    """
+    Asserts that each (left, right) pair is close in both directions,
+    looking up the conversion between any two Metrics only once for the
+    whole batch.
+    """
+    conversions = {}
+    for left, right in pairs:
+        for expected, actual in ((left, right), (right, left)):
+            if expected.metric != actual.metric:
+                key = (actual.metric, expected.metric)
+                if key not in conversions:
+                    assert actual.metric.is_convertible_to(expected.metric), failure_message + ": '%s' cannot be converted to '%s'" % (actual.metric, expected.metric)
+                    conversions[key] = actual.metric.to(expected.metric)
+                actual = conversions[key](actual)
+
+            assert_close(expected, actual, failure_message, tolerance)
+
+def assert_close_symmetric(left, right, failure_message = "", tolerance = None):
+    "Asserts that left is close to right and that right is close to left."
+    assert_close_batch([(left, right)], failure_message, tolerance)
+
 def assert_different(left, right, expected_percentage, tolerance = None):
     left = left.reduce()
     right = right.reduce()
@@ -60,30 +80,70 @@ class axioms(object):
 
     expectations = {}
 
+    products = {}
+
+    operands = ["multiplicative_identity", "additive_identity", "fake_value", "another_fake_value", "distributable_with"]
+
+    validated = {}
+
+    validated_under = None
+
     @classmethod
     def hold_for(cls, subject):
-        results = {}
-        for property in cls.expectations:
-            results[property] = False
+        cls.hold_for_many([subject])
+
+    @classmethod
+    def hold_for_many(cls, subjects):
+        # every setUp assigns a fresh expectations dict, which invalidates the subjects validated
+        # under the previous one
+        if cls.validated_under is not cls.expectations:
+            cls.validated = {}
+            cls.validated_under = cls.expectations
+
+        properties = [getattr(cls, property) for property in cls.expectations]
+        operands = tuple(getattr(cls, operand, None) for operand in cls.operands)
+        configuration = (frozenset(cls.expectations.items()),) + tuple(id(operand) for operand in operands)
+
+        # products shared between properties (subject * fake_value, fake_value * another_fake_value,
+        # and so on) are computed once for the whole sweep
+        cls.products = {}
+        try:
+            for subject in subjects:
+                key = (id(subject),) + configuration
+                if key in cls.validated:
+                    continue
+
+                for property in properties:
+                    property(subject)
+
+                # the subject and operands are kept alongside the key so that their ids stay unique
+                cls.validated[key] = (subject, operands)
+        finally:
+            cls.products = {}
 
-        for property in results:
-            getattr(cls, property)(subject)
+    @classmethod
+    def product(cls, left, right):
+        key = (id(left), id(right))
+        if key not in cls.products:
+            # the operands are kept alongside the product so that their ids stay unique
+            cls.products[key] = (left, right, left * right)
+        return cls.products[key][2]
 
     @classmethod
     def commutative(cls, subject):
-        assert_close((subject * cls.fake_value), (cls.fake_value * subject), "Commutative property did not hold")
+        assert_close(cls.product(subject, cls.fake_value), cls.product(cls.fake_value, subject), "Commutative property did not hold")
 
     @classmethod
     def associative(cls, subject):
-        assert_close(((subject * cls.fake_value) * cls.another_fake_value), (subject * (cls.fake_value * cls.another_fake_value)), "Associative property did not hold")
+        assert_close((cls.product(subject, cls.fake_value) * cls.another_fake_value), (subject * cls.product(cls.fake_value, cls.another_fake_value)), "Associative property did not hold")
 
     @classmethod
     def distributive(cls, subject):
-        assert_close((cls.fake_value * (subject + cls.distributable_with)), ((cls.fake_value * subject) + (cls.fake_value * cls.distributable_with)), "Distributive property did not hold")
+        assert_close((cls.fake_value * (subject + cls.distributable_with)), (cls.product(cls.fake_value, subject) + cls.product(cls.fake_value, cls.distributable_with)), "Distributive property did not hold")
 
     @classmethod
     def identity_in_multiplication(cls, subject):
-        assert_close((subject * cls.multiplicative_identity), subject, "Multiplicative Identity (multiplication) did not hold")
+        assert_close(cls.product(subject, cls.multiplicative_identity), subject, "Multiplicative Identity (multiplication) did not hold")
         assert_close((subject / cls.multiplicative_identity), subject, "Multiplicative Identity (division) did not hold")
 
     @classmethod
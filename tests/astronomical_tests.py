@@ -1,13 +1,12 @@
 # coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
 from measurement.astronomical import *
 
 from . import arithmetic
+from . import axiom_fixtures
 from . import string_representations
 
 class AstronomicalMeasurementsTestCase(unittest.TestCase):
@@ -24,8 +23,8 @@ class AstronomicalMeasurementsTestCase(unittest.TestCase):
                                             "inverse": False
                                          }
         arithmetic.axioms.multiplicative_identity = One
-        arithmetic.axioms.fake_value = Metric("faken", "f", Dimension("Fake", "F"))
-        arithmetic.axioms.another_fake_value = Metric("untrut", "u", Dimension("Untruth", "UT"))
+        arithmetic.axioms.fake_value = axiom_fixtures.FakeMetric
+        arithmetic.axioms.another_fake_value = axiom_fixtures.AnotherFakeMetric
     def tearDown(self):
         arithmetic.axioms.expectations = None
         arithmetic.axioms.multiplicative_identity = None
@@ -0,0 +1,10 @@
+"""
+Metrics in Dimensions of their own, used as axioms.fake_value and
+axioms.another_fake_value by the unit system tests.  They are built once
+here rather than in every setUp.
+"""
+
+from measurement import Metric, Dimension
+
+FakeMetric = Metric("faken", "f", Dimension("Fake", "F"))
+AnotherFakeMetric = Metric("untrut", "u", Dimension("Untruth", "UT"))
@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
@@ -15,6 +13,10 @@ class ConstantTestCase(unittest.TestCase):
         assert Constant.get_by_name("absolute zero") == AbsoluteZero
         assert Constant.get_by_name("Guidry's Constant") == None
 
+    def testSlots(self):
+        "Constants, like all Quantities, don't carry a per-instance __dict__"
+        assert not hasattr(Pi, "__dict__")
+
     def testEulersFormula(self):
         "Euler's formula, our \"jewel\", states that e^(i*pi) + 1 = 0"
         arithmetic.assert_close(EulersNumber**(ImaginaryUnit*Pi) + Unity, Zero)
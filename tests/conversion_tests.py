@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-import six
 from decimal import Decimal
 
 import unittest
@@ -21,7 +19,7 @@ class DimensionTestCase(unittest.TestCase):
         try:
             Meter.to(Fahrenheit)
         except MetricConversionError as e:
-            assert six.text_type(e) == "There is no conversion between 'm' and '°F', because they measure different Dimensions.", six.text_type(e)
+            assert str(e) == "There is no conversion between 'm' and '°F', because they measure different Dimensions.", str(e)
         else:
             assert False, "There shouldn't be a conversion between meter and Fahrenheit."
 
@@ -37,7 +35,7 @@ class DimensionTestCase(unittest.TestCase):
         try:
             Meter.to(FakeLength)
         except MetricConversionError as e:
-            assert six.text_type(e) == "There is no conversion between 'm' and 'f'.", six.text_type(e)
+            assert str(e) == "There is no conversion between 'm' and 'f'.", str(e)
         else:
             assert False, "Trying to convert between meter and faken should have failed."
 
@@ -45,14 +43,14 @@ class DimensionTestCase(unittest.TestCase):
         try:
             Meter.to(Inch)(1 * Foot)
         except MetricConversionError as e:
-            assert six.text_type(e) == "Quantity '1 '' is not convertible with scalar conversion '0.0254 m/\"'", six.text_type(e)
+            assert str(e) == "Quantity '1 '' is not convertible with scalar conversion '0.0254 m/\"'", str(e)
         else:
             assert False, "Passing the wrong value should have thrown an error."
 
         try:
             Rankine.to(Celsius)(1 * Foot)
         except MetricConversionError as e:
-            assert six.text_type(e) == "Quantity '1 '' is not convertible with this conversion function between °R and °C", six.text_type(e)
+            assert str(e) == "Quantity '1 '' is not convertible with this conversion function between °R and °C", str(e)
         else:
             assert False, "Passing the wrong value should have thrown an error."
 
@@ -72,6 +70,17 @@ class DimensionTestCase(unittest.TestCase):
         conversion = Metric.find_conversion(untruthy, faken)
         self.assertEqual(conversion(Decimal(100.0) * untruthy), 1000.0 * faken)
 
+    def testRegisteringConversionsInBulk(self):
+        faken = Metric("faken", "f", Dimension("Truth"))
+        untruthy = Metric("untruthy", "ut", Dimension("Truth"))
+        falsity = Metric("falsity", "fl", Dimension("Truth"))
+        conversions = Metric.register_conversions([(10.0, faken, untruthy),
+                                                   (4.0, untruthy, falsity)])
+        self.assertEqual([conversion.scalar_factor for conversion in conversions],
+                         [Quantity(10.0, faken / untruthy), Quantity(4.0, untruthy / falsity)])
+        self.assertEqual(Metric.find_conversion(untruthy, faken)(Decimal(100.0) * untruthy), 1000.0 * faken)
+        self.assertEqual(Metric.find_conversion(falsity, untruthy)(2.0 * falsity), 8.0 * untruthy)
+
     def testInformationConversions(self):
         arithmetic.assert_close(16 * Bit, 2 * Octet)
         arithmetic.assert_close(3 * Octet, 24 * Bit)
@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
@@ -105,6 +103,41 @@ class DimensionTestCase(unittest.TestCase):
         assert (Dimension(terms = [Dimension.Term(Dimension("Fake", "F"), -1), Dimension.Term(Dimension("Untruthy", "UT"), -1)]) ==
                 Dimension(terms = [Dimension.Term(Dimension("Fake", "F"), -1), Dimension.Term(Dimension("Untruthy", "UT"), -1)]))
 
+    def testReuseOfFundamentalDimensions(self):
+        "Tests that redefining a fundamental Dimension reuses the registered instance."
+        assert Dimension("Fake", "F") is Dimension("Fake", "F")
+        assert Dimension("length", "L") is Length
+        assert Dimension("Faker", "F") is not Dimension("Fake", "F")
+
+    def testReuseOfDerivedDimensions(self):
+        "Tests that deriving a Dimension from equivalent terms reuses the existing instance."
+        assert (Dimension(terms = [Dimension.Term(Dimension("Fake", "F"), -1)]) is
+                Dimension(terms = [Dimension.Term(Dimension("Fake", "F"), -1)]))
+        assert Dimension(terms = [Dimension.Term(Length, 1), Dimension.Term(Time, -1)]) is Speed
+        assert Dimension(terms = [Dimension.Term(Length, 1), Dimension.Term(Time, -2)]) is Length / Time**2
+
+    def testDerivedDimensionRegistryIsBounded(self):
+        max_dimensions_by_exponents = Dimension.max_dimensions_by_exponents
+        Dimension.max_dimensions_by_exponents = len(Dimension.dimensions_by_exponents)
+        try:
+            derived = Length**17
+            assert Dimension.dimensions_by_exponents.get((("length", 17),)) is derived
+            assert Dimension.dimensions_by_exponents[Length.exponents] is Length
+            assert Dimension.dimensions_by_exponents[Speed.exponents] is Speed
+            assert len(Dimension.dimensions_by_exponents) <= len(Dimension.defined_dimensions_by_terms) + 1
+        finally:
+            Dimension.max_dimensions_by_exponents = max_dimensions_by_exponents
+
+    def testExponents(self):
+        "Tests that a Dimension's exponents are its fundamental Dimensions and their powers."
+        assert Length.exponents == (("length", 1),), Length.exponents
+        assert Number.exponents == (), Number.exponents
+        assert Speed.exponents == (("length", 1), ("time", -1)), Speed.exponents
+        assert Length * Length is Area
+        assert Length / Time is Speed
+        assert Length**3 is Volume
+        assert Length / Length is Number
+
     def testInequality(self):
         "Tests that a Dimension has a sane definition of inequality."
         assert Dimension("Untruthy", "UT") != Dimension("Fake", "F")
@@ -198,6 +231,10 @@ class DimensionTestCase(unittest.TestCase):
         dimension = Dimension.parse("L^12")
         assert dimension == Length**12
 
+    def testParsingTypographicalExponents(self):
+        assert Dimension.parse("L·T⁻¹") == Length / Time
+        assert Dimension.parse("L²") == Length**2
+
     def testParsingEmpty(self):
         assert Dimension.symbol_string_to_terms("") == []
 
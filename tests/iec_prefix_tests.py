@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
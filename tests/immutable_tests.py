@@ -1,8 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-import six
-
 import unittest
 
 from measurement import Immutable
@@ -20,7 +17,7 @@ class ImmutableTests(unittest.TestCase):
             f.value = "y"
             self.assertTrue(False, "The exception wasn't thrown.")
         except AttributeError as e:
-            self.assertEqual(six.text_type(e), "Frigid is immutable.")
+            self.assertEqual(str(e), "Frigid is immutable.")
 
     def test_delattr(self):
         f = ImmutableTests.Frigid()
@@ -35,4 +32,4 @@ class ImmutableTests(unittest.TestCase):
             del(f.value)
             self.assertTrue(False, "The exception wasn't thrown.")
         except AttributeError as e:
-            self.assertEqual(six.text_type(e), "Frigid is immutable.")
+            self.assertEqual(str(e), "Frigid is immutable.")
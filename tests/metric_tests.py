@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
@@ -124,6 +122,13 @@ class MetricTestCase(unittest.TestCase):
         assert Meter.__div__("hi") == NotImplemented
         assert Meter.__rdiv__("hi") == NotImplemented
 
+    def testNormalization(self):
+        assert Meter.normalize() == (1, (("meter", 1),)), Meter.normalize()
+        assert (Kilo*Meter).normalize() == (1000, (("meter", 1),)), (Kilo*Meter).normalize()
+        assert (Meter / Second).normalize() == Metric(terms = [Metric.Term(None, Meter, 1), Metric.Term(None, Second, -1)]).normalize()
+        assert (Kilo*Meter).normalize() != Meter.normalize()
+        assert Meter.normalize() is Meter.normalize()
+
     def testEqualityOutsideOfClassOnlySupportsNumbers(self):
         assert Meter.__eq__("hi") == NotImplemented
         assert Meter.__ne__("hi") == NotImplemented
@@ -132,6 +137,29 @@ class MetricTestCase(unittest.TestCase):
         assert Metric.parse("m^15") == Meter**15
         assert Metric.parse("m^-15") == Meter**-15
 
+    def testParsingIsCached(self):
+        assert Metric.parse("m/s") is Metric.parse("m/s")
+        assert Metric.parse("m/s") == Meter / Second
+
+        before = Metric.parse("m/s")
+        Metric("faken", "f", Dimension("Fake", "F"))
+        assert "m/s" not in Metric.parsed_metrics
+        assert Metric.parse("m/s") == before
+
+    def testParsingCacheIsBounded(self):
+        max_parsed_metrics = Metric.max_parsed_metrics
+        Metric.max_parsed_metrics = 2
+        try:
+            Metric.parsed_metrics = {}
+            Metric.parse("m/s")
+            Metric.parse("m/h")
+            assert len(Metric.parsed_metrics) == 2
+            Metric.parse("g/s")
+            assert list(Metric.parsed_metrics) == ["g/s"]
+            assert Metric.parse("m/s") == Meter / Second
+        finally:
+            Metric.max_parsed_metrics = max_parsed_metrics
+
     def testParsingEmpty(self):
         assert Metric.symbol_string_to_terms("") == []
 
@@ -139,7 +167,7 @@ class MetricTestCase(unittest.TestCase):
         try:
             Metric.parse("-")
         except MeasurementParsingException as e:
-            self.assertEqual(six.text_type(e), "'-' doesn't seem to correspond to any defined Metrics.")
+            self.assertEqual(str(e), "'-' doesn't seem to correspond to any defined Metrics.")
         else:
             assert False, "Parsing '-' should have raised."
 
@@ -152,6 +180,10 @@ class MetricTestCase(unittest.TestCase):
         assert (One * Meter * One) == Meter
         assert (One * (Meter / Second) * One) == Meter / Second
 
+        assert (One * Meter) is Meter
+        assert (Meter * One) is Meter
+        assert (Meter / One) is Meter
+
     def testOne(self):
         assert One == One
         assert One == Ten**0
@@ -192,6 +224,37 @@ class MetricTestCase(unittest.TestCase):
         assert ((Meter / Second)**2) == (Meter / Second) * (Meter / Second)
         assert ((Meter / Second)**3) == (Meter / Second) * (Meter / Second) * (Meter / Second)
 
+        assert (Meter**15)**2 == Meter**30
+        assert ((Kilo*Meter)**2)**3 == (Kilo*Meter)**6
+        assert Meter**1 is Meter
+
+    def testMemoizationOfArithmetic(self):
+        assert (Meter * Second) is (Meter * Second)
+        assert (Meter / Second) is (Meter / Second)
+        assert (Meter**2) is (Meter**2)
+        assert ((Meter**2 * (Kilo*Gram)) / (Second**3 * Ampere**2)) is ((Meter**2 * (Kilo*Gram)) / (Second**3 * Ampere**2))
+        assert ((Deci*Meter)**3) is ((Deci*Meter)**3)
+
+        faken = Metric("faken", "f", Dimension("Fake", "F"))
+        untrut = Metric("untrut", "u", Dimension("Untruth", "UT"))
+        assert (faken * untrut).name != "fakentrut"
+        fakentrut = Metric("fakentrut", "fu", derivation = faken * untrut)
+        assert (faken * untrut) is fakentrut
+
+    def testArithmeticMemoIsBounded(self):
+        max_derived_metrics = Metric.max_derived_metrics
+        Metric.max_derived_metrics = 2
+        try:
+            Metric.derived_metrics_by_operation = {}
+            Meter * Second
+            Meter / Second
+            assert len(Metric.derived_metrics_by_operation) == 2
+            Meter**2
+            assert len(Metric.derived_metrics_by_operation) == 1
+            assert Meter * Second == Metric(terms = [Metric.Term(None, Meter, 1), Metric.Term(None, Second, 1)])
+        finally:
+            Metric.max_derived_metrics = max_derived_metrics
+
     def testRaisingAMetricToAFractionalPowerIsOrthogonal(self):
         assert (Meter**0.5)**2 == Meter, (Meter**0.5)**2
         assert (Meter**2)**0.5 == Meter, (Meter**2)**0.5
@@ -289,5 +352,6 @@ class MetricTestCase(unittest.TestCase):
 
     def testRegistration(self):
         assert Meter in Metric.all()
+        assert Metric.all() is Metric.all()
         assert Meter == Metric.get_by_name("meter")
         assert Metric.get_by_name("foobar") == None
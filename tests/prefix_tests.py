@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
 from measurement import *
@@ -37,7 +35,7 @@ class PrefixTestCase(unittest.TestCase):
         try:
             Metric.Prefix.define(Metric.Prefix("FOO", "BAR", 10, 3))
         except KeyError as e:
-            self.assertEqual(six.text_type(e), repr("Multiple definitions of Metric.Prefix with base 10 and power 3"))
+            self.assertEqual(str(e), repr("Multiple definitions of Metric.Prefix with base 10 and power 3"))
         else:
             assert False, "Metric.Prefix.define should have thrown an exception re-defining a prefix."
 
@@ -45,7 +43,7 @@ class PrefixTestCase(unittest.TestCase):
         try:
             Kilo * 10
         except Exception as e:
-            assert six.text_type(e) == "unsupported operand type(s) for *: 'Prefix' and 'int'", six.text_type(e)
+            assert str(e) == "unsupported operand type(s) for *: 'Prefix' and 'int'", str(e)
         else:
             assert False, "Metric.Prefix.register should have thrown an exception re-registering a prefix."
 
@@ -130,7 +128,7 @@ class PrefixTestCase(unittest.TestCase):
         assert this_cubic_kilometer.name == "kilometer³", this_cubic_kilometer.name
         assert this_cubic_kilometer.typographical_symbol == "km³", this_cubic_kilometer.typographical_symbol
         assert this_cubic_kilometer.dimension == Volume, this_cubic_kilometer.dimension
-        arithmetic.axioms.hold_for(this_cubic_kilometer)
+        arithmetic.axioms.hold_for_many([kilometer, square_kilometer, this_cubic_kilometer])
         string_representations.should_represent_orthogonally(this_cubic_kilometer)
 
     def testNegativePoweredSIPrefixPrecedenceForSquaring(self):
@@ -163,7 +161,7 @@ class PrefixTestCase(unittest.TestCase):
         assert this_cubic_nanometer.name == "nanometer³", this_cubic_nanometer.name
         assert this_cubic_nanometer.typographical_symbol == "nm³", this_cubic_nanometer.typographical_symbol
         assert this_cubic_nanometer.dimension == Volume, this_cubic_nanometer.dimension
-        arithmetic.axioms.hold_for(this_cubic_nanometer)
+        arithmetic.axioms.hold_for_many([nanometer, square_nanometer, this_cubic_nanometer])
         string_representations.should_represent_orthogonally(this_cubic_nanometer)
 
     def testApplicationOfPrefixesInQuantityArithmetic(self):
@@ -245,14 +243,14 @@ class PrefixTestCase(unittest.TestCase):
         try:
             Kilo + Kibi
         except TypeError as e:
-            assert six.text_type(e) == "unsupported operand type(s) for +: 'Prefix' and 'Prefix'", six.text_type(e)
+            assert str(e) == "unsupported operand type(s) for +: 'Prefix' and 'Prefix'", str(e)
         else:
             assert False, "You can't add prefixes in different bases."
 
         try:
             Kilo + 1
         except TypeError as e:
-            assert six.text_type(e) == "unsupported operand type(s) for +: 'Prefix' and 'int'", six.text_type(e)
+            assert str(e) == "unsupported operand type(s) for +: 'Prefix' and 'int'", str(e)
         else:
             assert False, "You can't add Prefixes to anything besides Prefixes."
 
@@ -269,14 +267,14 @@ class PrefixTestCase(unittest.TestCase):
         try:
             Kilo - Kibi
         except TypeError as e:
-            assert six.text_type(e) == "unsupported operand type(s) for -: 'Prefix' and 'Prefix'", six.text_type(e)
+            assert str(e) == "unsupported operand type(s) for -: 'Prefix' and 'Prefix'", str(e)
         else:
             assert False, "You can't subtract prefixes in different bases."
 
         try:
             Kilo - 1
         except TypeError as e:
-            assert six.text_type(e) == "unsupported operand type(s) for -: 'Prefix' and 'int'", six.text_type(e)
+            assert str(e) == "unsupported operand type(s) for -: 'Prefix' and 'int'", str(e)
         else:
             assert False, "You can't subtract Prefixes to anything besides Prefixes."
 
@@ -286,3 +284,8 @@ class PrefixTestCase(unittest.TestCase):
 
     def testUnicode(self):
         assert str(Kilo) == Kilo.typographical_symbol
+
+    def testMagnitude(self):
+        assert Kilo.magnitude == 1000, Kilo.magnitude
+        assert Milli.magnitude == 0.001, Milli.magnitude
+        assert Kibi.magnitude == 1024, Kibi.magnitude
@@ -1,7 +1,5 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 from decimal import Decimal
 
 import unittest
@@ -11,6 +9,12 @@ from measurement import *
 from . import arithmetic
 from . import string_representations
 
+DecimalZero = Decimal("0.0")
+DecimalOne = Decimal("1.0")
+DecimalFour = Decimal("4.0")
+
+AxiomMetrics = [One, Meter, Meter / Second, Ohm]
+
 class QuantityTestCase(unittest.TestCase):
     def setUp(self):
         arithmetic.axioms.expectations = {
@@ -35,26 +39,23 @@ class QuantityTestCase(unittest.TestCase):
     def testImmutability(self):
         five_meters = Quantity(5, Meter)
 
-        try:
+        with self.assertRaises(AttributeError) as raised:
             five_meters.magnitude = 10
-        except AttributeError as e:
-            assert six.text_type(e) == "Quantity is immutable."
-        else:
-            assert False, "Quantity should be immutable"
+        self.assertEqual(str(raised.exception), "Quantity is immutable.")
 
-        try:
+        with self.assertRaises(AttributeError) as raised:
             five_meters.metric = Candela
-        except AttributeError as e:
-            assert six.text_type(e) == "Quantity is immutable."
-        else:
-            assert False, "Quantity should be immutable"
+        self.assertEqual(str(raised.exception), "Quantity is immutable.")
 
-        try:
+        with self.assertRaises(AttributeError) as raised:
             del five_meters.metric
-        except AttributeError as e:
-            assert six.text_type(e) == "Quantity is immutable."
-        else:
-            assert False, "Quantity should be immutable"
+        self.assertEqual(str(raised.exception), "Quantity is immutable.")
+
+    def testSlots(self):
+        five_meters = Quantity(5.5, Meter)
+        assert not hasattr(five_meters, "__dict__")
+        with self.assertRaises(AttributeError):
+            five_meters.color = "red"
 
     def testHashability(self):
         assert hash(Quantity(5, Meter)) != 0
@@ -63,10 +64,24 @@ class QuantityTestCase(unittest.TestCase):
         assert hash(Quantity(5, Meter)) != hash(Quantity(5, Candela))
         assert hash(Quantity(5, Meter)) != hash(Quantity(5, Meter / Second))
 
+    def testConstructionWithUnhashableMagnitudes(self):
+        "Tests that a Quantity is only hashed on demand, so that any magnitude can be held."
+        signaling = Quantity(Decimal("sNaN"), Meter)
+        assert signaling.metric is Meter
+        listed = Quantity([1, 2], Meter)
+        assert listed.magnitude == [1, 2]
+        with self.assertRaises(TypeError):
+            hash(listed)
+
     def testEquality(self):
         "Tests that a Metric has a sane definition of equality."
         assert Quantity(5, Meter) == Quantity(5, Meter)
         assert Quantity(5, Meter / Second) == Quantity(5, Meter / Second)
+        assert Quantity(5.5, Meter) == Quantity(5.5, Meter)
+        assert Quantity(5.5, Meter) != Quantity(6.5, Meter)
+        assert Quantity(Decimal("5.5"), Meter) == Quantity(Decimal("5.5"), Meter)
+        assert Quantity(Decimal("5.5"), Meter) == Quantity(5.5, Meter)
+        assert Quantity(float("nan"), Meter) != Quantity(float("nan"), Meter)
 
     def testInequality(self):
         "Tests that a Metric has a sane definition of inequality."
@@ -157,6 +172,15 @@ class QuantityTestCase(unittest.TestCase):
 
     def testCompositeValues(self):
         assert Quantity(5, "m").__composite_values__() == (5, "m")
+        five_meters = Quantity(5.0, Meter)
+        assert five_meters.__composite_values__() is five_meters.__composite_values__()
+
+    def testReductionIsCached(self):
+        two_kilometers = Quantity(2.0, Kilo*Meter)
+        assert two_kilometers.reduce() == Quantity(2000.0, Meter)
+        assert two_kilometers.reduce() is two_kilometers.reduce()
+        five_meters = Quantity(5.0, Meter)
+        assert five_meters.reduce() is five_meters
 
     def testNonZero(self):
         assert bool(Quantity(1, "m"))
@@ -166,54 +190,58 @@ class QuantityTestCase(unittest.TestCase):
         try:
             Quantity.parse("foobar")
         except MeasurementParsingException as e:
-            assert six.text_type(e) == "Could not parse 'foobar' to a Quantity.", six.text_type(e)
+            assert str(e) == "Could not parse 'foobar' to a Quantity.", str(e)
         else:
             assert False, "Parsing nonsense should have thrown"
 
+    def testParsingIsCached(self):
+        assert Quantity.parse("20.3 m/s") is Quantity.parse("20.3 m/s")
+        assert Quantity.parse("20.3 m/s") == Quantity(20.3, Meter / Second)
+        assert Quantity.parse("20", to = float) == Quantity(20.0, One)
+        assert isinstance(Quantity.parse("20", to = float).magnitude, float)
+        assert isinstance(Quantity.parse("20").magnitude, int)
+
+        for _ in range(2):
+            with self.assertRaises(MeasurementParsingException):
+                Quantity.parse("foobar")
+        assert ("foobar", None) not in Quantity.parsed_quantities
+
     def testCoercion(self):
         self.assertEqual(Decimal("10.0") * Meter, 10.0 * Meter)
         self.assertEqual(10.0 * Meter, Decimal("10.0") * Meter)
+        self.assertNotEqual(Decimal("10.0") * Meter, 10.5 * Meter)
+        self.assertLess(Decimal("10.0") * Meter, 10.5 * Meter)
+        self.assertLess(Decimal("10.0") * Meter, Decimal("10.5") * Meter)
+
+    def hold_axioms_across_metrics(self, scenarios):
+        """
+        Checks the arithmetic axioms in each of the AxiomMetrics, given a
+        (zero, distributable_with, subject) scenario of magnitudes for each.
+        """
+        assert len(scenarios) == len(AxiomMetrics), scenarios
+        for metric, (zero, distributable_with, subject) in zip(AxiomMetrics, scenarios):
+            arithmetic.axioms.additive_identity = Quantity(zero, metric)
+            arithmetic.axioms.distributable_with = Quantity(distributable_with, metric)
+            arithmetic.axioms.hold_for(Quantity(subject, metric))
 
     def testArithmeticAxiomsOverIntegers(self):
-        arithmetic.axioms.additive_identity = Quantity(0, One)
-        arithmetic.axioms.distributable_with = Quantity(4, One)
-        arithmetic.axioms.hold_for(Quantity(10, One))
-
-        arithmetic.axioms.additive_identity = Quantity(0, Meter)
-        arithmetic.axioms.distributable_with = Quantity(4, Meter)
-        arithmetic.axioms.hold_for(Quantity(4, Meter))
-
-        arithmetic.axioms.additive_identity = Quantity(0, Meter / Second)
-        arithmetic.axioms.distributable_with = Quantity(4, Meter / Second)
-        arithmetic.axioms.hold_for(Quantity(5, Meter / Second))
-
-        arithmetic.axioms.additive_identity = Quantity(0, Ohm)
-        arithmetic.axioms.distributable_with = Quantity(4, Ohm)
-        arithmetic.axioms.hold_for(Quantity(6, Ohm))
+        self.hold_axioms_across_metrics([(0, 4, 10),
+                                         (0, 4, 4),
+                                         (0, 4, 5),
+                                         (0, 4, 6)])
 
     def testStringConversionForIntegers(self):
         string_representations.should_represent_orthogonally(Quantity(10, One))
         string_representations.should_represent_orthogonally(Quantity(4, Meter))
         string_representations.should_represent_orthogonally(Quantity(5, Meter / Second))
         string_representations.should_represent_orthogonally(Quantity(6, Ohm))
-        assert six.text_type(10 * Ten) == "100", six.text_type(10 * Ten)
+        assert str(10 * Ten) == "100", str(10 * Ten)
 
     def testArithmeticAxiomsOverLongs(self):
-        arithmetic.axioms.additive_identity = Quantity(int(0), One)
-        arithmetic.axioms.distributable_with = Quantity(int(4), One)
-        arithmetic.axioms.hold_for(Quantity(int(10), One))
-
-        arithmetic.axioms.additive_identity = Quantity(int(0), Meter)
-        arithmetic.axioms.distributable_with = Quantity(int(4), Meter)
-        arithmetic.axioms.hold_for(Quantity(int(4), Meter))
-
-        arithmetic.axioms.additive_identity = Quantity(int(0), Meter / Second)
-        arithmetic.axioms.distributable_with = Quantity(int(4), Meter / Second)
-        arithmetic.axioms.hold_for(Quantity(int(5), Meter / Second))
-
-        arithmetic.axioms.additive_identity = Quantity(int(0), Ohm)
-        arithmetic.axioms.distributable_with = Quantity(int(4), Ohm)
-        arithmetic.axioms.hold_for(Quantity(int(6), Ohm))
+        self.hold_axioms_across_metrics([(int(0), int(4), int(10)),
+                                         (int(0), int(4), int(4)),
+                                         (int(0), int(4), int(5)),
+                                         (int(0), int(4), int(6))])
 
     def testStringConversionForLongs(self):
         string_representations.should_represent_orthogonally(Quantity(int(10), One))
@@ -230,21 +258,10 @@ class QuantityTestCase(unittest.TestCase):
         assert Quantity(1, Meter) // Quantity(2, Meter) == 0
 
     def testArithmeticAxiomsOverReals(self):
-        arithmetic.axioms.additive_identity = Quantity(0.0, One)
-        arithmetic.axioms.distributable_with = Quantity(4.0, One)
-        arithmetic.axioms.hold_for(Quantity(10.5, One))
-
-        arithmetic.axioms.additive_identity = Quantity(0.0, Meter)
-        arithmetic.axioms.distributable_with = Quantity(4.0, Meter)
-        arithmetic.axioms.hold_for(Quantity(4.8, Meter))
-
-        arithmetic.axioms.additive_identity = Quantity(0.0, Meter / Second)
-        arithmetic.axioms.distributable_with = Quantity(4.0, Meter / Second)
-        arithmetic.axioms.hold_for(Quantity(6.5, Meter / Second))
-
-        arithmetic.axioms.additive_identity = Quantity(0.0, Ohm)
-        arithmetic.axioms.distributable_with = Quantity(4.0, Ohm)
-        arithmetic.axioms.hold_for(Quantity(6.5, Ohm))
+        self.hold_axioms_across_metrics([(0.0, 4.0, 10.5),
+                                         (0.0, 4.0, 4.8),
+                                         (0.0, 4.0, 6.5),
+                                         (0.0, 4.0, 6.5)])
 
     def testStringConversionForReals(self):
         string_representations.should_represent_orthogonally(Quantity(1012.11115, One))
@@ -253,21 +270,7 @@ class QuantityTestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Quantity(613.232141245, Ohm))
 
     def testArithmeticAxiomsOverComplex(self):
-        arithmetic.axioms.additive_identity = Quantity(complex(0, 0), One)
-        arithmetic.axioms.distributable_with = Quantity(complex(1, 2), One)
-        arithmetic.axioms.hold_for(Quantity(complex(2, 3), One))
-
-        arithmetic.axioms.additive_identity = Quantity(complex(0, 0), Meter)
-        arithmetic.axioms.distributable_with = Quantity(complex(1, 2), Meter)
-        arithmetic.axioms.hold_for(Quantity(complex(2, 3), Meter))
-
-        arithmetic.axioms.additive_identity = Quantity(complex(0, 0), Meter / Second)
-        arithmetic.axioms.distributable_with = Quantity(complex(1, 2), Meter / Second)
-        arithmetic.axioms.hold_for(Quantity(complex(2, 3), Meter / Second))
-
-        arithmetic.axioms.additive_identity = Quantity(complex(0, 0), Ohm)
-        arithmetic.axioms.distributable_with = Quantity(complex(1, 2), Ohm)
-        arithmetic.axioms.hold_for(Quantity(complex(2, 3), Ohm))
+        self.hold_axioms_across_metrics([(complex(0, 0), complex(1, 2), complex(2, 3))] * len(AxiomMetrics))
 
     def testStringConversionForComplex(self):
         string_representations.should_represent_orthogonally(Quantity(complex(2, 3), One))
@@ -276,25 +279,14 @@ class QuantityTestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Quantity(complex(5, 6), Ohm))
 
     def testArithmeticAxiomsOverDecimals(self):
-        arithmetic.axioms.multiplicative_identity = Quantity(Decimal("1.0"), One)
+        arithmetic.axioms.multiplicative_identity = Quantity(DecimalOne, One)
         arithmetic.axioms.fake_value = Quantity(Decimal("123.4"), Second)
         arithmetic.axioms.another_fake_value = Quantity(Decimal("-32"), Ohm)
 
-        arithmetic.axioms.additive_identity = Quantity(Decimal("0.0"), One)
-        arithmetic.axioms.distributable_with = Quantity(Decimal("4.0"), One)
-        arithmetic.axioms.hold_for(Quantity(Decimal("10.5"), One))
-
-        arithmetic.axioms.additive_identity = Quantity(Decimal("0.0"), Meter)
-        arithmetic.axioms.distributable_with = Quantity(Decimal("4.0"), Meter)
-        arithmetic.axioms.hold_for(Quantity(Decimal("8.0"), Meter))
-
-        arithmetic.axioms.additive_identity = Quantity(Decimal("0.0"), Meter / Second)
-        arithmetic.axioms.distributable_with = Quantity(Decimal("2.32222"), Meter / Second)
-        arithmetic.axioms.hold_for(Quantity(Decimal("4.3"), Meter / Second))
-
-        arithmetic.axioms.additive_identity = Quantity(Decimal("0.0"), Ohm)
-        arithmetic.axioms.distributable_with = Quantity(Decimal("4.0"), Ohm)
-        arithmetic.axioms.hold_for(Quantity(Decimal("6.5"), Ohm))
+        self.hold_axioms_across_metrics([(DecimalZero, DecimalFour, Decimal("10.5")),
+                                         (DecimalZero, DecimalFour, Decimal("8.0")),
+                                         (DecimalZero, Decimal("2.32222"), Decimal("4.3")),
+                                         (DecimalZero, DecimalFour, Decimal("6.5"))])
 
     def testStringConversionForDecimals(self):
         # use huge numbers to convince the parser that these are decimals
@@ -321,6 +313,14 @@ class QuantityTestCase(unittest.TestCase):
     def testDivision(self):
         assert Quantity(12.0, Meter) / Quantity(4.0, Second) == Quantity(3.0, Meter / Second)
 
+    def testIntegralPowers(self):
+        assert Quantity(4.0, Meter)**2 == Quantity(16.0, Meter**2)
+        assert Quantity(4, Meter)**3 == Quantity(64, Meter**3)
+        assert Quantity(2.0, Meter)**-2 == Quantity(0.25, Meter**-2)
+        assert Quantity(4, Meter)**0 == 1
+        five_meters = Quantity(5.5, Meter)
+        assert five_meters**1 is five_meters
+
     def testSquareRoot(self):
         assert Quantity(16.0, Meter**2)**0.5 == Quantity(4.0, Meter)
 
@@ -331,10 +331,10 @@ class QuantityTestCase(unittest.TestCase):
         try:
             Quantity(10, Meter)**[]
         except TypeError as e:
-            assert six.text_type(e) in (
+            assert str(e) in (
                     "unsupported operand type(s) for ** or pow(): 'Quantity' and 'list'",
                     "operands do not support **"
-                   ), six.text_type(e)
+                   ), str(e)
         else:
             assert False, "Quantity should be immutable"
 
@@ -1,18 +1,38 @@
 #coding=utf-8
 
-from __future__ import division, unicode_literals
-
 import unittest
 
-from measurement import *
+from measurement import (One, Kilo, Deci, Milli, Nano,
+                         Meter, Gram, Second, Ampere, Kelvin, Mole, Candela,
+                         Radian, Steradian, Hertz, Coulomb, Joule, Ohm, Volt, Watt, Liter, Angstrom,
+                         Number, Length, Mass, Time, Current, Temperature, AmountOfSubstance, LuminousIntensity,
+                         Frequency, Charge, Energy, Resistance, Voltage, Power, Volume)
 
 from . import arithmetic
+from . import axiom_fixtures
 from . import string_representations
 
+Kilogram = Kilo*Gram
+SquareMeter = Meter**2
+CubicMeter = Meter**3
+SquareSecond = Second**2
+CubicSecond = Second**3
+
+SIBaseUnits = [
+    (Meter, "meter", "m", Length),
+    (Gram, "gram", "g", Mass),
+    (Second, "second", "s", Time),
+    (Ampere, "ampere", "A", Current),
+    (Kelvin, "kelvin", "K", Temperature),
+    (Mole, "mole", "mol", AmountOfSubstance),
+    (Candela, "candela", "cd", LuminousIntensity),
+]
+
 class SITestCase(unittest.TestCase):
     "Tests the SI System of Units."
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         arithmetic.axioms.expectations = {
                                             "commutative": False,
                                             "associative": False,
@@ -20,63 +40,17 @@ class SITestCase(unittest.TestCase):
                                             "inverse": False
                                          }
         arithmetic.axioms.multiplicative_identity = One
-        arithmetic.axioms.fake_value = Metric("faken", "f", Dimension("Fake", "F"))
-        arithmetic.axioms.another_fake_value = Metric("untrut", "u", Dimension("Untruth", "UT"))
-    def tearDown(self):
+        arithmetic.axioms.fake_value = axiom_fixtures.FakeMetric
+        arithmetic.axioms.another_fake_value = axiom_fixtures.AnotherFakeMetric
+    @classmethod
+    def tearDownClass(cls):
         arithmetic.axioms.expectations = None
         arithmetic.axioms.multiplicative_identity = None
         arithmetic.axioms.fake_value = None
         arithmetic.axioms.another_fake_value = None
 
     def testSIBaseUnits(self):
-        assert Meter != None
-        assert Meter.name == "meter", Meter.name
-        assert Meter.typographical_symbol == "m", Meter.typographical_symbol
-        assert Meter.dimension == Length, Meter.dimension
-        arithmetic.axioms.hold_for(Meter)
-        string_representations.should_represent_orthogonally(Meter)
-
-        assert Gram != None
-        assert Gram.name == "gram", Gram.name
-        assert Gram.typographical_symbol == "g", Gram.typographical_symbol
-        assert Gram.dimension == Mass, Gram.dimension
-        arithmetic.axioms.hold_for(Gram)
-        string_representations.should_represent_orthogonally(Gram)
-
-        assert Second != None
-        assert Second.name == "second", Second.name
-        assert Second.typographical_symbol == "s", Second.typographical_symbol
-        assert Second.dimension == Time, Second.dimension
-        arithmetic.axioms.hold_for(Second)
-        string_representations.should_represent_orthogonally(Second)
-
-        assert Ampere != None
-        assert Ampere.name == "ampere", Ampere.name
-        assert Ampere.typographical_symbol == "A", Ampere.typographical_symbol
-        assert Ampere.dimension == Current, Ampere.dimension
-        arithmetic.axioms.hold_for(Ampere)
-        string_representations.should_represent_orthogonally(Ampere)
-
-        assert Kelvin != None
-        assert Kelvin.name == "kelvin", Kelvin.name
-        assert Kelvin.typographical_symbol == "K", Kelvin.typographical_symbol
-        assert Kelvin.dimension == Temperature, Kelvin.dimension
-        arithmetic.axioms.hold_for(Kelvin)
-        string_representations.should_represent_orthogonally(Kelvin)
-
-        assert Mole != None
-        assert Mole.name == "mole", Mole.name
-        assert Mole.typographical_symbol == "mol", Mole.typographical_symbol
-        assert Mole.dimension == AmountOfSubstance, Mole.dimension
-        arithmetic.axioms.hold_for(Mole)
-        string_representations.should_represent_orthogonally(Mole)
-
-        assert Candela != None
-        assert Candela.name == "candela", Candela.name
-        assert Candela.typographical_symbol == "cd", Candela.typographical_symbol
-        assert Candela.dimension == LuminousIntensity, Candela.dimension
-        arithmetic.axioms.hold_for(Candela)
-        string_representations.should_represent_orthogonally(Candela)
+        string_representations.should_register_units(self, SIBaseUnits)
 
     def testSIDerivedUnits(self):
         assert Radian != None
@@ -88,7 +62,7 @@ class SITestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Radian)
 
         assert Steradian != None
-        assert Steradian == (Meter**2 / Meter**2)
+        assert Steradian == (SquareMeter / SquareMeter)
         assert Steradian.name == "steradian", Steradian.name
         assert Steradian.typographical_symbol == "sr", Steradian.typographical_symbol
         assert Steradian.dimension == Number, Steradian.dimension
@@ -112,7 +86,7 @@ class SITestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Coulomb)
 
         assert Joule != None
-        assert Joule == (Kilo*Gram) * ((Meter**2) / (Second**2))
+        assert Joule == Kilogram * (SquareMeter / SquareSecond)
         assert Joule.name == "joule", Joule.name
         assert Joule.typographical_symbol == "J", Joule.typographical_symbol
         assert Joule.dimension == Energy, Joule.dimension
@@ -120,7 +94,7 @@ class SITestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Joule)
 
         assert Ohm != None
-        assert Ohm == ( (Meter**2 * (Kilo * Gram)) / (Second**3 * Ampere**2) )
+        assert Ohm == (SquareMeter * Kilogram) / (CubicSecond * Ampere**2)
         assert Ohm.name == "ohm", Ohm.name
         assert Ohm.typographical_symbol == "Ω", Ohm.typographical_symbol
         assert Ohm.dimension == Resistance, Ohm.dimension
@@ -129,7 +103,7 @@ class SITestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Ohm)
 
         assert Volt != None
-        assert Volt == ( (Meter**2 * (Kilo * Gram)) / (Second**3 * Ampere) )
+        assert Volt == (SquareMeter * Kilogram) / (CubicSecond * Ampere)
         assert Volt.name == "volt", Volt.name
         assert Volt.typographical_symbol == "V", Volt.typographical_symbol
         assert Volt.dimension == Voltage, Volt.dimension
@@ -137,7 +111,7 @@ class SITestCase(unittest.TestCase):
         string_representations.should_represent_orthogonally(Volt)
 
         assert Watt != None
-        assert Watt == ((Kilo * Gram) * Meter**2) / Second**3
+        assert Watt == (Kilogram * SquareMeter) / CubicSecond
         assert Watt.name == "watt", Watt.name
         assert Watt.typographical_symbol == "W", Watt.typographical_symbol
         assert Watt.dimension == Power, Watt.dimension
@@ -158,14 +132,14 @@ class SITestCase(unittest.TestCase):
         arithmetic.axioms.hold_for(Milli*Liter)
         string_representations.should_represent_orthogonally(Milli*Liter)
 
-        arithmetic.assert_close(1 * Liter, 0.001 * Meter**3)
-        arithmetic.assert_close(0.001 * Meter**3, 1 * Liter)
+        arithmetic.assert_close(1 * Liter, 0.001 * CubicMeter)
+        arithmetic.assert_close(0.001 * CubicMeter, 1 * Liter)
 
-        arithmetic.assert_close(Liter.reduce(), 0.001 * Meter**3)
-        arithmetic.assert_close(0.001 * Meter**3, Liter.reduce())
+        arithmetic.assert_close(Liter.reduce(), 0.001 * CubicMeter)
+        arithmetic.assert_close(0.001 * CubicMeter, Liter.reduce())
 
-        arithmetic.assert_close(1 * (Milli*Liter), 0.000001 * Meter**3)
-        arithmetic.assert_close(0.000001 * Meter**3, 1 * (Milli*Liter))
+        arithmetic.assert_close(1 * (Milli*Liter), 0.000001 * CubicMeter)
+        arithmetic.assert_close(0.000001 * CubicMeter, 1 * (Milli*Liter))
 
 
 
@@ -1,10 +1,56 @@
-from __future__ import division, unicode_literals
-
-from measurement import *
+# reprs are evaluated against this module's globals, so these names are needed
+# even though nothing here refers to them directly
+from measurement import Dimension, Metric, Quantity
 
 from decimal import Decimal
 
+from . import arithmetic
+
+represented_orthogonally = {}
+"""
+The objects already shown to represent orthogonally, keyed by id, so that
+repeated checks of long-lived Metrics skip the eval() and parse round trips.
+The objects themselves are held so that their ids cannot be reused.
+"""
+
+compiled_representations = {}
+"""
+The compiled form of each repr() already evaluated, keyed by the repr()
+itself, so that equal objects share a single trip through the compiler.
+"""
+
+def evaluate_representation(representation):
+    if representation not in compiled_representations:
+        compiled_representations[representation] = compile(representation, "<repr>", "eval")
+    return eval(compiled_representations[representation])
+
 def should_represent_orthogonally(incoming):
-    assert eval(repr(incoming)) == incoming, "%s != %s" % (repr(incoming), repr(eval(repr(incoming))))
+    if id(incoming) in represented_orthogonally:
+        return
+
+    representation = repr(incoming)
+    evaluated = evaluate_representation(representation)
+    assert evaluated == incoming, "%s != %s" % (representation, repr(evaluated))
+
+    parsed = incoming.__class__.parse(str(incoming))
+    assert parsed == incoming, "%s != %s" % (parsed, incoming)
+
+    represented_orthogonally[id(incoming)] = incoming
 
-    assert incoming.__class__.parse(six.text_type(incoming)) == incoming, "%s != %s" % (incoming.__class__.parse(six.text_type(incoming)), incoming)
+def should_register_units(test_case, units, dimension = None):
+    """
+    Checks each (metric, name, typographical_symbol[, dimension]) row of a
+    table of units in a subTest of its own: the Metric's name, symbol and
+    Dimension, the arithmetic axioms and its orthogonal representations.
+    Rows without a Dimension are checked against the one given.
+    """
+    for row in units:
+        metric, name, typographical_symbol = row[:3]
+        expected_dimension = row[3] if len(row) > 3 else dimension
+        with test_case.subTest(metric = name):
+            assert metric != None
+            assert metric.name == name, metric.name
+            assert metric.typographical_symbol == typographical_symbol, metric.typographical_symbol
+            assert metric.dimension == expected_dimension, metric.dimension
+            arithmetic.axioms.hold_for(metric)
+            should_represent_orthogonally(metric)